@@ -2,26 +2,172 @@
 
 import curses
 import curses.panel
-from typing import List, Dict, Optional
-from datetime import datetime
+import textwrap
+import unicodedata
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import Future
+from functools import lru_cache
+from types import MappingProxyType
 import os
-import sys
 import logging
+from utils import format_timestamp
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One TextWrapper per width; textwrap.wrap() would build a new one per call
+_wrappers: Dict[int, textwrap.TextWrapper] = {}
+
+@lru_cache(maxsize=512)
+def _wrap_text(text: str, width: int) -> Tuple[str, ...]:
+    """Wrap text to fit within specified width (memoized per text/width)."""
+    if not text:
+        return ()
+    width = max(width, 1)
+    wrapper = _wrappers.get(width)
+    if wrapper is None:
+        wrapper = _wrappers[width] = textwrap.TextWrapper(
+            width=width, break_long_words=True, break_on_hyphens=False
+        )
+    return tuple(wrapper.wrap(text))
+
+def _truncate_to_width(text: str, max_width: int) -> str:
+    """Truncate text to a number of terminal columns, counting wide characters as two."""
+    widths = [2 if unicodedata.east_asian_width(c) in 'WF' else 1 for c in text]
+    if sum(widths) <= max_width:
+        return text
+
+    used = 0
+    for i, char_width in enumerate(widths):
+        if used + char_width > max_width - 3:
+            return text[:i] + "..."
+        used += char_width
+    return text
+
+def _pad_to_width(text: str, width: int) -> str:
+    """
+    Cut or pad text to exactly width terminal columns, counting wide
+    characters as two. Rows written in one batch must all be this wide, or
+    every following row is shifted.
+    """
+    if text.isascii():
+        return text[:width].ljust(width)
+    used = 0
+    for i, char in enumerate(text):
+        char_width = 2 if unicodedata.east_asian_width(char) in 'WF' else 1
+        if used + char_width > width:
+            # A wide character that would straddle the edge becomes padding
+            return text[:i] + " " * (width - used)
+        used += char_width
+    return text + " " * (width - used)
+
+_STATUS_TEXT = "↑/↓: Navigate | Space: Mark | a: Approve | d: Dismiss | r: Revoke | q: Quit"
+_MARK = "*"
+# How often to check for a background refresh while waiting for a key
+_REFRESH_POLL_MS = 200
+
+# Detail pane layout: (section title, ((label, key path into the request), ...))
+_REQUEST_TIME_PATH = ('requestTime',)
+_SECTION_TEMPLATE = (
+    ("Basic Information", (
+        ("Name", ('name',)),
+        ("State", ('state',)),
+        ("Request Time", _REQUEST_TIME_PATH),
+    )),
+    ("Resource Details", (
+        ("Resource", ('requestedResourceName',)),
+    )),
+    ("Request Context", (
+        ("Type", ('requestedReason', 'type')),
+        ("Detail", ('requestedReason', 'detail')),
+    )),
+)
+
+_NO_FIELDS = MappingProxyType({})
+
+# Labels for the requestedLocations keys the API defines; other keys are
+# split into words by _location_label()
+_LOCATION_LABELS = {
+    'principalOfficeCountry': 'Principal Office Country',
+    'principalPhysicalLocationCountry': 'Principal Physical Location Country',
+}
+
+def _location_label(key: str) -> str:
+    """Return the detail pane label for a requestedLocations key."""
+    label = _LOCATION_LABELS.get(key)
+    if label is None:
+        label = key.replace('principal', 'Principal ').replace('Country', ' Country')
+    return label
+
+def _lookup(request: Dict, path: Tuple[str, ...]):
+    """Follow a key path into a request, returning 'N/A' if the field is missing."""
+    value = request
+    for key in path[:-1]:
+        # Missing or null parent fields resolve against a shared empty mapping
+        value = value.get(key) or _NO_FIELDS
+    return value.get(path[-1], 'N/A')
+
+class _WindowPool:
+    """
+    Holds the most recently released set of viewer windows so a viewer
+    re-entered with the same geometry can reuse them instead of calling
+    newwin() again. curses only has one screen, so at most one set is kept.
+    """
+    def __init__(self):
+        self._geometry = None
+        self._windows = None
+
+    def get(self, geometry: Tuple[int, int, int]) -> Optional[Tuple]:
+        """Take the pooled windows if they were created for this geometry."""
+        if self._windows is None or self._geometry != geometry:
+            return None
+        windows = self._windows
+        self._geometry = self._windows = None
+        return windows
+
+    def release(self, geometry: Tuple[int, int, int], windows: Tuple):
+        """Return a set of windows to the pool, replacing any previous set."""
+        self._geometry = geometry
+        self._windows = windows
+
+_window_pool = _WindowPool()
+_colors_initialized = False
+
 class RequestViewer:
     def __init__(self, requests: List[Dict]):
-        self.requests = requests
+        # The viewer never mutates the request sequence, so freeze it
+        self.requests = tuple(requests)
+        self._request_times = self._format_request_times(self.requests)
         self.current_index = 0
         self.top_line = 0
+        # Indexes of requests marked for a batched action
+        self.marked = set()
+        # Background fetch of a fresh request list, applied when it completes
+        self._pending = None
+        # Set while a resize has left the terminal below the minimum size
+        self._too_small = False
         self.window = None
         self.detail_window = None
         self.status_window = None
+        self.list_body = None
+        self.detail_body = None
+        self._panels = ()
+        self._geometry = None
+        self._visible_rows = 0
+        self._attr_selected = 0
+        self._attr_normal = 0
+        self._attr_header = 0
         self.min_terminal_height = 10
         self.min_terminal_width = 80
+        # Damage tracking: state as of the last paint, None forces a redraw
+        self._last_index = None
+        self._last_top = None
+        self._detail_index = None
+        # Prerendered rows, built by _prerender() once the window geometry is known
+        self._list_labels = ()
+        self._rendered = []
+        self._detail_width = 0
 
     def check_terminal_size(self):
         """Check if terminal meets minimum size requirements."""
@@ -56,59 +202,96 @@ class RequestViewer:
             height, width = curses.LINES, curses.COLS
             logger.debug(f"Terminal size: {width}x{height}")
 
-            # Initialize color pairs if supported
-            if curses.has_colors():
+            # Initialize color pairs if supported; pairs survive endwin(), so
+            # this only needs to happen on the first viewer of the process
+            global _colors_initialized
+            if curses.has_colors() and not _colors_initialized:
                 try:
                     curses.start_color()
                     curses.use_default_colors()
                     for i in range(1, 4):
                         curses.init_pair(i, i, -1)
+                    _colors_initialized = True
                 except Exception as e:
                     logger.warning(f"Failed to initialize colors: {e}")
 
+            # Resolve the attributes used by the display loops once
+            self._attr_selected = curses.color_pair(1)
+            self._attr_normal = curses.color_pair(2)
+            self._attr_header = curses.color_pair(3) | curses.A_BOLD
+
             # Create main window for request list (1/3 of screen width)
             list_width = max(30, min(width // 3, 50))
-            self.window = curses.newwin(height - 2, list_width, 0, 0)
-            if not self.window:
-                raise Exception("Failed to create main window")
-            self.window.keypad(True)
-
-            # Create detail window (remaining width)
-            detail_width = width - list_width
-            self.detail_window = curses.newwin(height - 2, detail_width, 0, list_width)
-            if not self.detail_window:
-                raise Exception("Failed to create detail window")
-
-            # Create status window at bottom
-            self.status_window = curses.newwin(2, width, height - 2, 0)
-            if not self.status_window:
-                raise Exception("Failed to create status window")
-
-            # Initial refresh of all windows
+            self._geometry = (height, width, list_width)
+            self._visible_rows = height - 4  # List rows inside the borders
+            pooled = _window_pool.get(self._geometry)
+            if pooled:
+                (self.window, self.list_body, self.detail_window,
+                 self.detail_body, self.status_window, self._panels) = pooled
+                self.window.keypad(True)
+            else:
+                self._create_windows(height, width, list_width)
+
+            # Queue a full clear of the screen; the windows themselves are
+            # flushed with the first frame's update_panels()/doupdate()
             stdscr.clear()
-            stdscr.refresh()
-            self.window.refresh()
-            self.detail_window.refresh()
-            self.status_window.refresh()
+            stdscr.noutrefresh()
+
+            self._prerender()
+            self.display_status()
 
         except Exception as e:
             logger.error(f"Failed to initialize windows: {e}")
             self.clean_up()
             raise
 
+    def _create_windows(self, height: int, width: int, list_width: int):
+        """Allocate the list, detail and status windows for the given geometry."""
+        # Create main window for request list
+        self.window = curses.newwin(height - 2, list_width, 0, 0)
+        if not self.window:
+            raise Exception("Failed to create main window")
+        self.window.keypad(True)
+        # Interior of the bordered list window, written in one batch per frame
+        self.list_body = self.window.derwin(height - 4, list_width - 2, 1, 1)
+
+        # Create detail window (remaining width)
+        detail_width = width - list_width
+        self.detail_window = curses.newwin(height - 2, detail_width, 0, list_width)
+        if not self.detail_window:
+            raise Exception("Failed to create detail window")
+        self.detail_body = self.detail_window.derwin(height - 4, detail_width - 2, 1, 1)
+
+        # Create status window at bottom
+        self.status_window = curses.newwin(2, width, height - 2, 0)
+        if not self.status_window:
+            raise Exception("Failed to create status window")
+
+        # Panels keep the windows' stacking order; update_panels() queues
+        # every window for the next doupdate() in that order
+        self._panels = tuple(
+            curses.panel.new_panel(window)
+            for window in (self.window, self.detail_window, self.status_window)
+        )
+
     def clean_up(self):
         """Clean up curses windows and restore terminal state."""
         try:
             if self.window:
                 self.window.keypad(False)
-                self.window.clear()
+                self.window.erase()
                 self.window.refresh()
             if self.detail_window:
-                self.detail_window.clear()
+                self.detail_window.erase()
                 self.detail_window.refresh()
             if self.status_window:
-                self.status_window.clear()
+                self.status_window.erase()
                 self.status_window.refresh()
+            if self.window and self.detail_window and self.status_window:
+                _window_pool.release(self._geometry, (
+                    self.window, self.list_body, self.detail_window,
+                    self.detail_body, self.status_window, self._panels
+                ))
 
             # Reset terminal settings
             try:
@@ -122,11 +305,11 @@ class RequestViewer:
 
     def format_timestamp(self, timestamp: str) -> str:
         """Format API timestamp to human-readable format."""
-        try:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
-        except ValueError:
-            return timestamp
+        return format_timestamp(timestamp)
+
+    def _format_request_times(self, requests: Tuple[Dict, ...]) -> Tuple[str, ...]:
+        """Format every request time once when requests are loaded."""
+        return tuple(self.format_timestamp(r.get('requestTime', 'N/A')) for r in requests)
 
     def safe_addstr(self, window, y: int, x: int, text: str, attr=0):
         """Safely add a string to a window, handling boundaries and errors."""
@@ -138,9 +321,12 @@ class RequestViewer:
             if y < 0 or x < 0 or y >= height or x >= width:
                 return
 
-            # Truncate text if it would exceed window width
+            # Truncate text if it would exceed window width. ASCII text is one
+            # column per character, so only other text needs a width scan
             max_len = width - x
-            if len(text) > max_len:
+            if not text.isascii():
+                text = _truncate_to_width(text, max_len)
+            elif len(text) > max_len:
                 text = text[:max_len-3] + "..."
 
             window.addstr(y, x, text, attr)
@@ -149,35 +335,121 @@ class RequestViewer:
 
     def wrap_text(self, text: str, width: int) -> List[str]:
         """Wrap text to fit within specified width."""
-        if not text:
-            return []
+        return list(_wrap_text(text, width))
+
+    def _prerender(self):
+        """
+        Build the session-invariant list labels and reset the per-request
+        detail cache. Must be called whenever the requests or the window
+        geometry change.
+        """
+        _, width, list_window_width = self._geometry
+        body_width = list_window_width - 2  # Inside the borders
+        list_width = body_width - 2  # Account for padding
+
+        labels = []
+        for request in self.requests:
+            # Get the request ID (last part of the name)
+            name = request.get('name', 'N/A').rsplit('/', 1)[-1]
+            display_text = _truncate_to_width(f" {name} ", list_width)
+            # Pad to the full body width so consecutive labels fill whole rows
+            labels.append(_pad_to_width(display_text, body_width))
+        self._list_labels = tuple(labels)
+
+        self._detail_width = width - list_window_width - 2
+        self._rendered = [None] * len(self.requests)
+
+    def _detail_rows(self, index: int) -> Tuple[Tuple[str, ...], Tuple[Tuple[int, int, int], ...]]:
+        """
+        Return the prerendered detail body for a request, rendering on first use.
+        The body is a list of lines padded to the body width plus the
+        (row, col, length) spans of the section headers to highlight.
+        """
+        rendered = self._rendered[index]
+        if rendered is not None:
+            return rendered
+
+        request = self.requests[index]
+        body_width = self._detail_width
+        indent = 1  # Body is inset one column from the window border
+        content_width = body_width - indent  # Keep a matching right margin
+
+        # Resolve the static sections from the template
+        sections = []
+        for section_title, fields in _SECTION_TEMPLATE:
+            items = []
+            for label, path in fields:
+                if path == _REQUEST_TIME_PATH:
+                    items.append((label, self._request_times[index]))
+                else:
+                    items.append((label, _lookup(request, path)))
+            sections.append((section_title, items))
+
+        # Add locations if present
+        locations = request.get('requestedLocations') or _NO_FIELDS
+        if locations:
+            location_items = []
+            for key, value in locations.items():
+                location_items.append((_location_label(key), value))
+            if location_items:
+                sections.append(("Locations", location_items))
 
         lines = []
-        while text:
-            if len(text) <= width:
-                lines.append(text)
-                break
-            split_point = text.rfind(' ', 0, width)
-            if split_point == -1:
-                split_point = width
-            lines.append(text[:split_point])
-            text = text[split_point:].lstrip()
-        return lines
-
-    def display_request_list(self):
-        """Display the list of requests in the main window."""
+        headers = []
+        for section_title, items in sections:
+            title = section_title + ":"
+            headers.append((len(lines), indent, len(title)))
+            lines.append(" " * indent + title)
+
+            for label, value in items:
+                label_text = " " * (indent + 2) + f"{label}: "
+
+                # Handle multiline values
+                wrapped_lines = _wrap_text(str(value), content_width - len(label_text))
+                if not wrapped_lines:  # If value was empty
+                    lines.append(label_text)
+                for i, line in enumerate(wrapped_lines):
+                    lines.append((label_text if i == 0 else " " * len(label_text)) + line)
+
+            lines.append("")  # Add space between sections
+
+        # Wrapping counts characters, so lines with wide characters can still
+        # overflow; mark those with "..." the same way safe_addstr() does
+        lines = tuple(_pad_to_width(_truncate_to_width(line, body_width), body_width)
+                      for line in lines)
+        self._rendered[index] = (lines, tuple(headers))
+        return self._rendered[index]
+
+    def display_request_list(self, previous_index: Optional[int] = None):
+        """
+        Display the list of requests in the main window. When previous_index
+        is given and the list has not scrolled since the last paint, only the
+        old and new selected rows are restyled.
+        """
         if not self.window:
             return
 
         try:
-            self.window.clear()
+            if previous_index is not None and self.requests:
+                row_width = self._geometry[2] - 4
+                old_row = previous_index - self.top_line
+                if 0 <= old_row < self._visible_rows:
+                    self.list_body.chgat(old_row, 0, row_width, self._attr_normal)
+                self.list_body.chgat(self.current_index - self.top_line, 0, row_width,
+                                     self._attr_selected)
+                # Nothing touched the parent window, so propagate the changes
+                # for update_panels() to pick up
+                self.list_body.syncup()
+                return
+
+            self.window.erase()
             self.window.box()
-            height, width = self.window.getmaxyx()
+            height, width = self._geometry[0] - 2, self._geometry[2]
 
             # Display header
             header = " Requests "
-            self.safe_addstr(self.window, 0, (width - len(header)) // 2, header, 
-                            curses.color_pair(3) | curses.A_BOLD)
+            self.safe_addstr(self.window, 0, (width - len(header)) // 2, header,
+                             self._attr_header)
 
             # If no requests, display message
             if not self.requests:
@@ -185,150 +457,77 @@ class RequestViewer:
                 y_pos = height // 2
                 x_pos = (width - len(message)) // 2
                 self.safe_addstr(self.window, y_pos, x_pos, message)
-                self.window.refresh()
                 return
 
-            # Calculate available space for list items
-            list_height = height - 2  # Account for borders
-            list_width = width - 4    # Account for borders and padding
-
-            # Display requests
-            for i in range(min(list_height, len(self.requests))):
-                idx = i + self.top_line
-                if idx >= len(self.requests):
-                    break
-
-                request = self.requests[idx]
-                # Get the request ID (last part of the name)
-                name = request.get('name', 'N/A').split('/')[-1]
-
-                # Format display text
-                display_text = f" {name} "
-                if len(display_text) > list_width:
-                    display_text = display_text[:list_width-3] + "..."
-
-                # Clear line first
-                self.window.move(i + 1, 1)
-                self.window.clrtoeol()
-
-                # Highlight selected item
-                attr = curses.color_pair(1) if idx == self.current_index else curses.color_pair(2)
-
-                # Fill entire line width for better highlighting
-                padding = " " * (list_width - len(display_text))
-                self.safe_addstr(self.window, i + 1, 1, display_text + padding, attr)
-
-            self.window.refresh()
+            # Write the visible slice of the prerendered labels in one call;
+            # each label is padded to the body width so rows wrap in place
+            visible = self._list_labels[self.top_line:self.top_line + self._visible_rows]
+            try:
+                self.list_body.addstr(0, 0, "".join(visible), self._attr_normal)
+            except curses.error:
+                pass  # Filling the bottom-right cell reports an error after writing
+
+            # Flag marked rows in the padding column of their labels
+            for index in self.marked:
+                row = index - self.top_line
+                if 0 <= row < len(visible):
+                    self.list_body.addstr(row, 0, _MARK, self._attr_normal)
+
+            # Highlight selected item
+            selected_row = self.current_index - self.top_line
+            if 0 <= selected_row < len(visible):
+                self.list_body.chgat(selected_row, 0, width - 4, self._attr_selected)
         except curses.error:
             pass
 
-    def display_request_details(self, request: Dict):
-        """Display detailed information about the selected request."""
+    def display_request_details(self, index: Optional[int]):
+        """Display detailed information about the request at the given index."""
         if not self.detail_window:
             return
 
         try:
-            self.detail_window.clear()
+            self.detail_window.erase()
             self.detail_window.box()
-            height, width = self.detail_window.getmaxyx()
+            height, width = self._geometry[0] - 2, self._geometry[1] - self._geometry[2]
 
             # Display header
             header = " Request Details "
-            self.safe_addstr(self.detail_window, 0, (width - len(header)) // 2, header, 
-                            curses.color_pair(3) | curses.A_BOLD)
+            self.safe_addstr(self.detail_window, 0, (width - len(header)) // 2, header,
+                             self._attr_header)
 
             # If no request, display message
-            if not request:
+            if index is None or index >= len(self.requests):
                 message = "No request selected"
                 y_pos = height // 2
                 x_pos = (width - len(message)) // 2
                 self.safe_addstr(self.detail_window, y_pos, x_pos, message)
-                self.detail_window.refresh()
                 return
 
-            y = 1
-            indent = 2
-            content_width = width - 2 * indent  # Double indent for better readability
-
-            # Define sections with their content
-            sections = [
-                ("Basic Information", [
-                    ("Name", request.get('name', 'N/A')),
-                    ("State", request.get('state', 'N/A')),
-                    ("Request Time", self.format_timestamp(request.get('requestTime', 'N/A')))
-                ]),
-                ("Resource Details", [
-                    ("Resource", request.get('requestedResourceName', 'N/A'))
-                ]),
-                ("Request Context", [
-                    ("Type", request.get('requestedReason', {}).get('type', 'N/A')),
-                    ("Detail", request.get('requestedReason', {}).get('detail', 'N/A'))
-                ])
-            ]
-
-            # Add locations if present
-            locations = request.get('requestedLocations', {})
-            if locations:
-                location_items = []
-                for key, value in locations.items():
-                    formatted_key = key.replace('principal', 'Principal ').replace('Country', ' Country')
-                    location_items.append((formatted_key, value))
-                if location_items:
-                    sections.append(("Locations", location_items))
-
-            # Display each section
-            for section_title, items in sections:
-                if y >= height - 2:
-                    break
-
-                # Display section header
-                self.safe_addstr(self.detail_window, y, indent, section_title + ":", 
-                            curses.color_pair(3) | curses.A_BOLD)
-                y += 1
-
-                # Display items in section
-                for label, value in items:
-                    if y >= height - 2:
-                        break
-
-                    # Format the label
-                    label_text = f"{label}: "
-                    self.safe_addstr(self.detail_window, y, indent + 2, label_text)
-
-                    # Handle multiline values
-                    value_indent = indent + 2 + len(label_text)
-                    available_width = content_width - len(label_text)
-                    wrapped_lines = self.wrap_text(str(value), available_width)
-
-                    for i, line in enumerate(wrapped_lines):
-                        if y >= height - 2:
-                            break
-                        if i == 0:
-                            self.safe_addstr(self.detail_window, y, value_indent, line)
-                        else:
-                            self.safe_addstr(self.detail_window, y, value_indent, line)
-                        y += 1
-
-                    if not wrapped_lines:  # If value was empty
-                        y += 1
-
-                y += 1  # Add space between sections
-
-            self.detail_window.refresh()
+            # Leave the last body row blank above the bottom border
+            body = self.detail_body
+            lines, headers = self._detail_rows(index)
+            visible = self._visible_rows - 1
+            body.addstr(0, 0, "".join(lines[:visible]))
+            chgat = body.chgat
+            header_attr = self._attr_header
+            for row, col, length in headers:
+                if row < visible:
+                    chgat(row, col, length, header_attr)
         except curses.error:
             pass
 
     def display_status(self):
-        """Display status and help information."""
+        """
+        Display status and help information. The text never changes, so this
+        is only called when the windows are (re)created.
+        """
         if not self.status_window:
             return
 
         try:
-            self.status_window.clear()
+            self.status_window.erase()
             self.status_window.box()
-            status_text = "↑/↓: Navigate | q: Quit | a: Approve | d: Dismiss | r: Revoke"
-            self.safe_addstr(self.status_window, 0, 2, status_text, curses.A_BOLD)
-            self.status_window.refresh()
+            self.status_window.addnstr(0, 2, _STATUS_TEXT, self._geometry[1] - 4, curses.A_BOLD)
         except curses.error:
             pass
 
@@ -336,37 +535,89 @@ class RequestViewer:
         """Run the interactive viewer."""
         try:
             self.create_windows(stdscr)
+            self.invalidate()
 
             while True:
                 try:
-                    if self.window:
-                        self.display_request_list()
-                        if self.requests:
-                            self.display_request_details(self.requests[self.current_index])
-                        self.display_status()
-
-                        # Handle key input
-                        key = self.window.getch()
+                    if self._too_small:
+                        # Only a notice is on screen; wait for the next resize
+                        key = stdscr.getch()
                         if key == ord('q'):
                             return None
-                        elif key == curses.KEY_UP and self.current_index > 0:
-                            self.current_index -= 1
-                            if self.current_index < self.top_line:
-                                self.top_line = self.current_index
-                        elif key == curses.KEY_DOWN and self.current_index < len(self.requests) - 1:
-                            self.current_index += 1
-                            if self.current_index >= self.top_line + (curses.LINES - 4):
-                                self.top_line += 1
-                        elif key in [ord('a'), ord('d'), ord('r')] and self.requests:
-                            action = {
-                                ord('a'): 'approve',
-                                ord('d'): 'dismiss',
-                                ord('r'): 'revoke'
-                            }[key]
-                            return {
-                                'action': action,
-                                'request': self.requests[self.current_index]
-                            }
+                        if key == curses.KEY_RESIZE:
+                            self.handle_resize(stdscr)
+                        continue
+
+                    if self.window:
+                        # Defer the detail pane while more keys are queued so
+                        # transient selections are never rendered. Peek before
+                        # painting: getch() flushes a window with pending changes
+                        detail_stale = self.current_index != self._detail_index
+                        if detail_stale and self._detail_index is not None and self._input_pending():
+                            detail_stale = False
+
+                        # Only repaint panes whose inputs changed (the status bar
+                        # is drawn with the windows), then flush all panels to
+                        # the screen in a single doupdate()
+                        if (self.current_index, self.top_line) != (self._last_index, self._last_top):
+                            if self.top_line == self._last_top:
+                                self.display_request_list(self._last_index)
+                            else:
+                                self.display_request_list()
+                            self._last_top = self.top_line
+                            self._last_index = self.current_index
+                        if detail_stale:
+                            if self.requests:
+                                self.display_request_details(self.current_index)
+                            self._detail_index = self.current_index
+                        curses.panel.update_panels()
+                        curses.doupdate()
+
+                        # Block for the next key, then drain any keys queued
+                        # behind it (e.g. a held arrow key) so a burst of
+                        # navigation is painted as a single frame
+                        if self._pending is not None:
+                            # Wake up periodically so a background refresh is
+                            # shown as soon as it lands
+                            self.window.timeout(_REFRESH_POLL_MS)
+                        key = self.window.getch()
+                        resized = False
+                        self.window.nodelay(True)
+                        try:
+                            while key != -1:
+                                if key == ord('q'):
+                                    return None
+                                elif key == curses.KEY_UP and self.current_index > 0:
+                                    self.current_index -= 1
+                                    if self.current_index < self.top_line:
+                                        self.top_line = self.current_index
+                                elif key == curses.KEY_DOWN and self.current_index < len(self.requests) - 1:
+                                    self.current_index += 1
+                                    if self.current_index >= self.top_line + self._visible_rows:
+                                        self.top_line += 1
+                                elif key == curses.KEY_RESIZE:
+                                    resized = True
+                                elif key == ord(' ') and self.requests:
+                                    self.toggle_mark()
+                                elif key in [ord('a'), ord('d'), ord('r')] and self.requests:
+                                    action = {
+                                        ord('a'): 'approve',
+                                        ord('d'): 'dismiss',
+                                        ord('r'): 'revoke'
+                                    }[key]
+                                    return {
+                                        'action': action,
+                                        'request': self.requests[self.current_index],
+                                        'requests': self.selected_requests()
+                                    }
+                                key = self.window.getch()
+                        finally:
+                            self.window.nodelay(False)
+
+                        if resized:
+                            self.handle_resize(stdscr)
+                        if self._pending is not None and self._pending.done():
+                            self._apply_pending()
 
                 except curses.error:
                     continue
@@ -376,24 +627,122 @@ class RequestViewer:
         finally:
             self.clean_up()
 
+    def toggle_mark(self):
+        """Mark or unmark the selected request for a batched action."""
+        self.marked ^= {self.current_index}
+        # Marks change the row text, so the list needs a full repaint
+        self._last_index = None
+
+    def selected_requests(self) -> List[Dict]:
+        """Return the marked requests in list order, or the selected request if none are marked."""
+        if self.marked:
+            return [self.requests[i] for i in sorted(self.marked)]
+        return [self.requests[self.current_index]]
+
+    def _input_pending(self) -> bool:
+        """Check for a queued key without consuming it."""
+        self.window.nodelay(True)
+        try:
+            key = self.window.getch()
+        finally:
+            self.window.nodelay(False)
+        if key == -1:
+            return False
+        curses.ungetch(key)
+        return True
+
+    def handle_resize(self, stdscr):
+        """
+        Rebuild the windows for the new terminal size and keep the selection
+        visible. A terminal below the minimum size shows a notice instead,
+        and the windows are rebuilt on the next resize that fits.
+        """
+        curses.update_lines_cols()
+        try:
+            self.check_terminal_size()
+        except Exception as e:
+            self._too_small = True
+            self.display_too_small(stdscr, str(e))
+            return
+        self._too_small = False
+        self.create_windows(stdscr)
+        if self.current_index >= self.top_line + self._visible_rows:
+            self.top_line = self.current_index - self._visible_rows + 1
+        self.invalidate()
+
+    def display_too_small(self, stdscr, message: str):
+        """Replace the screen with a notice that the terminal is too small."""
+        try:
+            stdscr.erase()
+            for row, text in enumerate((message, "Resize the terminal or press q to quit.")):
+                self.safe_addstr(stdscr, row, 0, text)
+            stdscr.refresh()
+        except curses.error:
+            pass
+
+    def invalidate(self):
+        """Mark every pane as needing a repaint on the next frame."""
+        self._last_index = None
+        self._last_top = None
+        self._detail_index = None
+
+    def refresh_in_background(self, future: Future):
+        """Show the current requests until the future's list is ready, then swap it in."""
+        self._pending = future
+
+    def _apply_pending(self):
+        """Replace the request list with the completed background refresh."""
+        future, self._pending = self._pending, None
+        try:
+            self.update_requests(future.result())
+        except Exception as e:
+            # Logging to the terminal would corrupt the screen, so keep the old list
+            logger.debug(f"Background refresh failed: {e}")
+
     def update_requests(self, new_requests: List[Dict]):
         """Update the request list and reset indexes if necessary."""
-        self.requests = new_requests
-        # Reset indexes if they're now out of bounds
-        if self.current_index >= len(new_requests):
-            self.current_index = max(0, len(new_requests) - 1)
-        if self.top_line >= len(new_requests):
-            self.top_line = max(0, len(new_requests) - 1)
-
-def view_requests(requests: List[Dict]) -> Optional[Dict]:
+        # Marks and the selection follow their requests by name, since
+        # indexes shift between lists
+        marked_names = {self.requests[i].get('name') for i in self.marked}
+        selected_name = (self.requests[self.current_index].get('name')
+                         if self.current_index < len(self.requests) else None)
+        self.requests = tuple(new_requests)
+        self._request_times = self._format_request_times(self.requests)
+        self.marked = {i for i, request in enumerate(self.requests)
+                       if request.get('name') in marked_names}
+
+        new_index = next((i for i, request in enumerate(self.requests)
+                          if request.get('name') == selected_name), None)
+        if selected_name is not None and new_index is not None:
+            # Keep the selected request on the same screen row where possible
+            self.top_line = max(0, self.top_line + new_index - self.current_index)
+            self.current_index = new_index
+            if self.top_line > new_index:
+                self.top_line = new_index
+            elif self._visible_rows and new_index >= self.top_line + self._visible_rows:
+                self.top_line = new_index - self._visible_rows + 1
+        else:
+            # The selected request is gone, so reset indexes if they're now out of bounds
+            if self.current_index >= len(new_requests):
+                self.current_index = max(0, len(new_requests) - 1)
+            if self.top_line >= len(new_requests):
+                self.top_line = max(0, len(new_requests) - 1)
+        if self.window and self.detail_window:
+            self._prerender()
+        self.invalidate()
+
+def view_requests(requests: List[Dict], refresh: Optional[Future] = None) -> Optional[Dict]:
     """
-    Launch the interactive viewer for the requests.
-    Returns a dict with 'action' and 'request' if user selects an action,
-    or None if user quits.
+    Launch the interactive viewer for the requests. If refresh is given, the
+    requests are shown until the future's updated list is ready.
+    Returns a dict with 'action', 'request' and the marked 'requests' if user
+    selects an action, or None if user quits.
     """
     try:
         logger.debug("Initializing interactive viewer")
         viewer = RequestViewer(requests)
+        if refresh is not None:
+            viewer.refresh_in_background(refresh)
         return curses.wrapper(lambda stdscr: viewer.run(stdscr))
     except Exception as e:
         logger.error(f"Error in interactive viewer: {e}")
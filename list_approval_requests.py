@@ -6,20 +6,86 @@ import json
 import argparse
 import logging
 import csv
-from typing import List, Dict
-from datetime import datetime
-import google.auth
-from google.oauth2 import service_account
-from googleapiclient import discovery
+import stat
+import tempfile
+from typing import List, Dict, Iterable, Iterator
+from itertools import chain
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from googleapiclient.errors import HttpError
-from google.auth.exceptions import DefaultCredentialsError
-from halo import Halo
-import curses
+from utils import format_timestamp
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maps --state choices to the list API's server-side filter values
+STATE_FILTERS = {
+    'PENDING': 'PENDING',
+    'APPROVED': 'ACTIVE',
+    'DISMISSED': 'DISMISSED',
+    'ALL': 'ALL',
+}
+
+# Ask for large pages to cut round trips; the server caps oversized values
+PAGE_SIZE = 1000
+
+# Read-only calls are retried with exponential backoff on 429 and 5xx responses;
+# approve, dismiss and invalidate are not, since a retried write can report a
+# spurious conflict after the first attempt went through
+NUM_RETRIES = 5
+
+# Upper bound on projects listed at the same time with --projects
+MAX_PROJECT_WORKERS = 8
+
+# The API accepts at most this many calls in one batch request
+BATCH_LIMIT = 100
+
+ACTION_PAST_TENSE = {
+    'approve': 'approved',
+    'dismiss': 'dismissed',
+    'revoke': 'revoked',
+}
+
+# Error explanations shared by the dismiss and revoke handlers
+PERMISSION_DENIED_MESSAGE = (
+    "Permission denied: {message}\n\n"
+    "To {task}, you need the following IAM permissions:\n"
+    "1. accessapproval.approvalRequests.{permission}\n"
+    "2. accessapproval.settings.update\n\n"
+    "To grant these permissions:\n"
+    "1. Visit the IAM & Admin console:\n"
+    "   https://console.cloud.google.com/iam-admin/iam\n"
+    "2. Find your account or service account\n"
+    "3. Add the 'Access Approval Admin' role\n"
+    "   (or add the specific permissions listed above)\n\n"
+    "For more information, see:\n"
+    "https://cloud.google.com/access-approval/docs/access-control"
+)
+
+NOT_FOUND_MESSAGE = (
+    "Request not found: {message}\n"
+    "The specified approval request may have expired or been deleted.\n"
+    "Use --state ALL to list all available requests."
+)
+
+INVALID_REQUEST_MESSAGE = (
+    "Invalid request: {message}\n"
+    "Please check that the request name is in the correct format:\n"
+    "projects/[PROJECT_ID]/approvalRequests/[REQUEST_ID]"
+)
+
+# Printed under the listing header and after every request
+SEPARATOR_LINE = "=" * 100 + "\n"
+
+# Shared read-only default for missing or null nested fields
+_NO_FIELDS = MappingProxyType({})
+
+# Read once at import, before any worker threads start: the umask can only be
+# queried by setting it, which would race with files created on other threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 def parse_arguments():
     """
     Parse command line arguments.
@@ -28,17 +94,23 @@ def parse_arguments():
     parser.add_argument('--state', choices=['PENDING', 'APPROVED', 'DISMISSED', 'ALL'],
                       default='PENDING',
                       help='Filter requests by state (default: PENDING)')
-    parser.add_argument('--approve',
-                      help='Approve a specific request by name (e.g., projects/123/approvalRequests/abc)')
-    parser.add_argument('--dismiss',
-                      help='Dismiss a pending request by name (e.g., projects/123/approvalRequests/abc)')
-    parser.add_argument('--revoke',
-                      help='Revoke an approved request by name (e.g., projects/123/approvalRequests/abc)')
+    parser.add_argument('--approve', nargs='+', metavar='NAME',
+                      help='Approve one or more requests by name (e.g., projects/123/approvalRequests/abc)')
+    parser.add_argument('--dismiss', nargs='+', metavar='NAME',
+                      help='Dismiss one or more pending requests by name (e.g., projects/123/approvalRequests/abc)')
+    parser.add_argument('--revoke', nargs='+', metavar='NAME',
+                      help='Revoke one or more approved requests by name (e.g., projects/123/approvalRequests/abc)')
+    parser.add_argument('--projects', nargs='+', metavar='PROJECT_ID',
+                      help='List requests across these projects concurrently instead of the default project')
     parser.add_argument('--export',
                       choices=['json', 'csv'],
                       help='Export the results in specified format')
     parser.add_argument('--output',
                       help='Output file path for export (default: approval_requests.<format>)')
+    parser.add_argument('--format',
+                      choices=['table', 'ndjson'],
+                      default='table',
+                      help='Output format for listing requests; ndjson writes one raw API object per line (default: table)')
     parser.add_argument('--interactive', '-i', action='store_true',
                       help='Launch interactive request viewer')
     parser.add_argument('--debug', action='store_true',
@@ -50,176 +122,308 @@ def setup_credentials():
     Set up Google Cloud credentials using default application credentials
     or service account key file.
     """
+    # ADC's last resort is probing the GCE metadata server, which off GCE waits
+    # out several 3 second attempts; google.auth reads this when first imported
+    os.environ.setdefault('GCE_METADATA_TIMEOUT', '1')
+
+    # Imported here so --help and argument errors don't pay for loading google-auth
+    import google.auth
+    from google.auth.exceptions import DefaultCredentialsError
+
+    key_path_or_content = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+    if key_path_or_content and key_path_or_content.lstrip().startswith('{'):
+        # ADC only reads this variable as a file path, so inline JSON content
+        # goes straight to the service account path
+        return load_service_account_credentials(key_path_or_content)
+
     try:
         # First try application default credentials
         credentials, _ = google.auth.default()
         return credentials, "320306361664"  # Using the specific project ID
     except DefaultCredentialsError:
         # If no default credentials, look for service account key file or content
-        key_path_or_content = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
         if not key_path_or_content:
             raise Exception(
                 "No credentials found. Please set GOOGLE_APPLICATION_CREDENTIALS "
                 "environment variable to point to your service account key file "
                 "or contain the service account JSON content."
             )
+        return load_service_account_credentials(key_path_or_content)
 
+def load_service_account_credentials(key_path_or_content: str):
+    """
+    Load service account credentials from JSON content or a key file path.
+    """
+    from google.oauth2 import service_account
+
+    try:
+        # First try to parse as JSON content
         try:
-            # First try to parse as JSON content
-            try:
-                info = json.loads(key_path_or_content)
-                credentials = service_account.Credentials.from_service_account_info(
-                    info,
-                    scopes=['https://www.googleapis.com/auth/cloud-platform']
-                )
-                return credentials, "320306361664"  # Using the specific project ID
-            except json.JSONDecodeError:
-                # If not valid JSON, try as file path
-                if not os.path.exists(key_path_or_content):
-                    raise Exception(
-                        f"Service account key file not found at: {key_path_or_content}"
-                    )
-                credentials = service_account.Credentials.from_service_account_file(
-                    key_path_or_content,
-                    scopes=['https://www.googleapis.com/auth/cloud-platform']
+            info = json.loads(key_path_or_content)
+            credentials = service_account.Credentials.from_service_account_info(
+                info,
+                scopes=['https://www.googleapis.com/auth/cloud-platform']
+            )
+            return credentials, "320306361664"  # Using the specific project ID
+        except json.JSONDecodeError:
+            # If not valid JSON, try as file path
+            if not os.path.exists(key_path_or_content):
+                raise Exception(
+                    f"Service account key file not found at: {key_path_or_content}"
                 )
-                return credentials, "320306361664"  # Using the specific project ID
-        except Exception as e:
-            raise Exception(f"Failed to setup credentials: {str(e)}")
+            credentials = service_account.Credentials.from_service_account_file(
+                key_path_or_content,
+                scopes=['https://www.googleapis.com/auth/cloud-platform']
+            )
+            return credentials, "320306361664"  # Using the specific project ID
+    except Exception as e:
+        raise Exception(f"Failed to setup credentials: {str(e)}")
+
+def refresh_credentials(credentials):
+    """
+    Fetch an access token up front so the first API call doesn't have to,
+    and so credential problems surface while authenticating.
+    """
+    if credentials.valid:
+        return
+
+    # google_auth_httplib2 ships with google-api-python-client, unlike requests
+    import httplib2
+    import google_auth_httplib2
+
+    try:
+        credentials.refresh(google_auth_httplib2.Request(httplib2.Http()))
+    except Exception as e:
+        raise Exception(f"Failed to refresh credentials: {str(e)}")
 
 def initialize_api_client(credentials):
     """
     Initialize the Access Approval API client.
     """
+    # The discovery module is the slowest import here, so load it on first use
+    from googleapiclient import discovery
+
     try:
+        # build() already uses the discovery document bundled with
+        # google-api-python-client when no discoveryServiceUrl is given; the
+        # flag only spells out that the API description is never fetched
         return discovery.build(
             'accessapproval',
             'v1',
             credentials=credentials,
-            cache_discovery=False
+            cache_discovery=False,
+            static_discovery=True
         )
     except Exception as e:
         raise Exception(f"Failed to initialize API client: {str(e)}")
 
-def format_timestamp(timestamp: str) -> str:
+def iter_approval_requests(client, project_id: str, state: str = 'PENDING') -> Iterator[Dict]:
     """
-    Format API timestamp to human-readable format.
+    Yield approval requests for the project filtered by state, one page at a time,
+    so callers can start consuming results before pagination completes.
     """
-    try:
-        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
-    except ValueError:
-        return timestamp
+    parent = f'projects/{project_id}'
+    logger.debug(f"Making API request with parent: {parent}")
 
-def get_approval_requests(client, project_id: str, state: str = 'PENDING') -> List[Dict]:
-    """
-    Retrieve approval requests for the project filtered by state.
-    """
     try:
-        parent = f'projects/{project_id}'
-        logger.debug(f"Making API request with parent: {parent}")
-
-        spinner = Halo(text='Fetching approval requests...', spinner='dots')
-        spinner.start()
-
-        try:
-            # List requests without filter first
-            request_kwargs = {'parent': parent}
-            request = client.projects().approvalRequests().list(**request_kwargs)
-
-            approval_requests = []
-            while request is not None:
+        # Let the server filter by state; an unset filter would mean
+        # "pending or active", so ALL is passed explicitly
+        request_kwargs = {'parent': parent, 'filter': STATE_FILTERS[state], 'pageSize': PAGE_SIZE}
+        # Build the resource once; each projects()/approvalRequests() call creates a new one
+        approval_resource = client.projects().approvalRequests()
+        request = approval_resource.list(**request_kwargs)
+
+        # Page tokens chain, so at most one page can usefully be in flight:
+        # the next page is fetched in the background while this one is consumed
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(request.execute, num_retries=NUM_RETRIES)
+            total = 0
+            while pending is not None:
                 try:
-                    response = request.execute()
-                    logger.debug(f"Raw API response: {json.dumps(response, indent=2)}")
-
-                    requests = response.get('approvalRequests', [])
-                    logger.debug(f"Found {len(requests)} requests in response")
-
-                    # Filter locally if state is specified
-                    if state != 'ALL':
-                        # Treat requests without state as PENDING
-                        filtered_requests = [r for r in requests if (r.get('state', 'PENDING') == state)]
-                        logger.debug(f"Filtered to {len(filtered_requests)} requests with state '{state}'")
-                        requests = filtered_requests
-
-                    approval_requests.extend(requests)
-                    request = client.projects().approvalRequests().list_next(
-                        previous_request=request,
-                        previous_response=response
-                    )
+                    response = pending.result()
                 except HttpError as e:
-                    error_details = json.loads(e.content.decode())
-                    logger.error(f"Error details: {json.dumps(error_details, indent=2)}")
+                    # HttpError has already parsed the body into reason/error_details
+                    if e.error_details:
+                        logger.debug(f"Error details: {e.error_details}")
                     if hasattr(e, 'resp'):
                         logger.error(f"Response status: {e.resp.status}")
-                        logger.error(f"Response headers: {e.resp.headers}")
+                        # httplib2.Response is itself the header mapping
+                        logger.error(f"Response headers: {dict(e.resp)}")
                     raise
+                # Skip serializing the whole page unless debug output is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Raw API response: {json.dumps(response, indent=2)}")
 
-            logger.debug(f"Total requests after filtering: {len(approval_requests)}")
-            spinner.succeed('Successfully retrieved approval requests')
-            return approval_requests
+                request = approval_resource.list_next(
+                    previous_request=request,
+                    previous_response=response
+                )
+                pending = (executor.submit(request.execute, num_retries=NUM_RETRIES)
+                           if request is not None else None)
 
-        except Exception as e:
-            spinner.fail(f'Failed to fetch approval requests: {str(e)}')
-            raise
-        finally:
-            if spinner.spinner_id:
-                spinner.stop()
+                requests = response.get('approvalRequests', [])
+                logger.debug(f"Found {len(requests)} requests in response")
+
+                total += len(requests)
+                yield from requests
+
+        logger.debug(f"Total requests with state '{state}': {total}")
 
     except HttpError as e:
-        error_details = json.loads(e.content.decode())
-        error_message = f"API request failed for project {project_id}: {error_details.get('error', {}).get('message', 'Unknown error')}"
+        error_message = f"API request failed for project {project_id}: {e.reason or 'Unknown error'}"
         logger.error(f"API Error: {error_message}")
         raise Exception(error_message)
 
-def display_approval_requests(approval_requests: List[Dict], state: str):
+def iter_project_requests(credentials, project_ids: List[str], state: str = 'PENDING') -> Iterator[Dict]:
+    """
+    List approval requests for several projects concurrently, yielding each
+    project's requests in the order the projects were given.
+    """
+    def fetch(project_id):
+        # httplib2 connections aren't thread-safe, so each project gets its own client
+        return list(iter_approval_requests(initialize_api_client(credentials), project_id, state))
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PROJECT_WORKERS, len(project_ids))) as executor:
+        for requests in executor.map(fetch, project_ids):
+            yield from requests
+
+class _DisabledSpinner:
+    """Stand-in for a disabled Halo spinner, so halo is only imported when one is shown."""
+    spinner_id = None
+
+    def start(self, text=None):
+        return self
+
+    def succeed(self, text=None):
+        return self
+
+    def fail(self, text=None):
+        return self
+
+    def stop(self):
+        return self
+
+def create_spinner(text: str, enabled: bool = True):
+    """
+    Create a progress spinner. Spinners are disabled when stdout is not a
+    terminal, so piped, cron and CI runs skip the render thread and its
+    escape sequences entirely, and never import halo.
+    """
+    if not (enabled and sys.stdout.isatty()):
+        return _DisabledSpinner()
+    from halo import Halo
+    return Halo(text=text, spinner='dots')
+
+def collect_with_spinner(requests: Iterable[Dict]) -> List[Dict]:
+    """
+    Consume a request iterator into a list behind a fetch spinner.
+    """
+    spinner = create_spinner('Fetching approval requests...')
+    spinner.start()
+
+    try:
+        approval_requests = list(requests)
+        spinner.succeed('Successfully retrieved approval requests')
+        return approval_requests
+    except Exception as e:
+        spinner.fail(f'Failed to fetch approval requests: {str(e)}')
+        raise
+    finally:
+        if spinner.spinner_id:
+            spinner.stop()
+
+def stream_with_spinner(requests: Iterable[Dict]) -> Iterator[Dict]:
+    """
+    Pass requests through as they arrive, showing a fetch spinner only until
+    the first one is available.
+    """
+    spinner = create_spinner('Fetching approval requests...')
+    spinner.start()
+
+    requests = iter(requests)
+    try:
+        first = next(requests, None)
+        spinner.succeed('Successfully retrieved approval requests')
+    except Exception as e:
+        spinner.fail(f'Failed to fetch approval requests: {str(e)}')
+        raise
+    finally:
+        if spinner.spinner_id:
+            spinner.stop()
+
+    if first is not None:
+        yield first
+        yield from requests
+
+def get_approval_requests(client, project_id: str, state: str = 'PENDING') -> List[Dict]:
+    """
+    Retrieve all approval requests for the project filtered by state.
+    """
+    return collect_with_spinner(iter_approval_requests(client, project_id, state))
+
+def display_approval_requests(approval_requests: Iterable[Dict], state: str):
     """
     Format and display approval requests in a readable format with detailed information.
+    Accepts any iterable, so requests can be printed as they are fetched.
     """
-    if not approval_requests:
+    approval_requests = iter(approval_requests)
+    first = next(approval_requests, None)
+    if first is None:
         state_msg = f" with state '{state}'" if state != 'ALL' else ""
         print(f"\nNo approval requests found{state_msg}.")
         return
 
-    print(f"\nApproval Requests{' (State: ' + state + ')' if state != 'ALL' else ''}:")
-    print("=" * 100)
-
-    for request in approval_requests:
-        # Basic Information
-        print(f"Request Name: {request.get('name', 'N/A')}")
-        print(f"State: {request.get('state', 'N/A')}")
-        print(f"Request Time: {format_timestamp(request.get('requestTime', 'N/A'))}")
-
-        # Resource Information
-        print(f"Requested Resource: {request.get('requestedResourceName', 'N/A')}")
-
-        # Request Reason
-        requested_reason = request.get('requestedReason', {})
-        print(f"Requested Reason: {requested_reason.get('type', 'N/A')}")
-        if requested_reason.get('detail'):
-            print(f"Reason Detail: {requested_reason.get('detail')}")
+    # One write per request instead of a print() per field; flushed once at the end
+    out = sys.stdout
+    out.write(f"\nApproval Requests{' (State: ' + state + ')' if state != 'ALL' else ''}:\n{SEPARATOR_LINE}")
 
-        # Time Information
-        print(f"Request Time: {format_timestamp(request.get('requestTime', 'N/A'))}")
+    for request in chain((first,), approval_requests):
+        get = request.get
+        request_time = format_timestamp(get('requestTime', 'N/A'))
+        requested_reason = get('requestedReason') or _NO_FIELDS
+        detail = requested_reason.get('detail')
 
         # Handle expiration time, which can be either a string or a dictionary
-        expiration = request.get('requestedExpiration', 'N/A')
+        expiration = get('requestedExpiration', 'N/A')
         if isinstance(expiration, dict):
             expire_time = expiration.get('expireTime', 'N/A')
         else:
             expire_time = expiration
         if expire_time != 'N/A':
             expire_time = format_timestamp(expire_time)
-        print(f"Expiration Time: {expire_time}")
 
-        print("=" * 100)
+        # Basic information, resource, reason, then expiration
+        block = (
+            f"Request Name: {get('name', 'N/A')}\n"
+            f"State: {get('state', 'N/A')}\n"
+            f"Request Time: {request_time}\n"
+            f"Requested Resource: {get('requestedResourceName', 'N/A')}\n"
+            f"Requested Reason: {requested_reason.get('type', 'N/A')}\n"
+        )
+        if detail:
+            block += f"Reason Detail: {detail}\n"
+        out.write(
+            f"{block}Expiration Time: {expire_time}\n"
+            f"{SEPARATOR_LINE}"
+        )
+
+    out.flush()
+
+def display_ndjson(approval_requests: Iterable[Dict]):
+    """
+    Write approval requests to stdout as newline-delimited JSON, one raw API
+    object per line, for scripts and tools such as jq.
+    """
+    out = sys.stdout
+    for request in approval_requests:
+        out.write(json.dumps(request, separators=(',', ':')) + "\n")
+    out.flush()
 
 def approve_request(client, request_name: str) -> bool:
     """
     Approve a specific access request.
     """
-    spinner = Halo(text=f'Approving request: {request_name}...', spinner='dots')
+    spinner = create_spinner(f'Approving request: {request_name}...')
     spinner.start()
 
     try:
@@ -253,37 +457,16 @@ def dismiss_request(client, request_name: str) -> bool:
         logger.info(f"Successfully dismissed request. New state: {response.get('state', 'UNKNOWN')}")
         return True
     except HttpError as e:
-        error_details = json.loads(e.content.decode())
-        error_message = error_details.get('error', {}).get('message', 'Unknown error')
-        error_code = error_details.get('error', {}).get('code')
+        error_message = e.reason or 'Unknown error'
+        error_code = e.resp.status
 
         if error_code == 403:  # Permission denied
-            error_message = (
-                f"Permission denied: {error_message}\n\n"
-                "To dismiss access requests, you need the following IAM permissions:\n"
-                "1. accessapproval.approvalRequests.dismiss\n"
-                "2. accessapproval.settings.update\n\n"
-                "To grant these permissions:\n"
-                "1. Visit the IAM & Admin console:\n"
-                "   https://console.cloud.google.com/iam-admin/iam\n"
-                "2. Find your account or service account\n"
-                "3. Add the 'Access Approval Admin' role\n"
-                "   (or add the specific permissions listed above)\n\n"
-                "For more information, see:\n"
-                "https://cloud.google.com/access-approval/docs/access-control"
-            )
+            error_message = PERMISSION_DENIED_MESSAGE.format(
+                message=error_message, task='dismiss access requests', permission='dismiss')
         elif error_code == 404:  # Request not found
-            error_message = (
-                f"Request not found: {error_message}\n"
-                "The specified approval request may have expired or been deleted.\n"
-                "Use --state ALL to list all available requests."
-            )
+            error_message = NOT_FOUND_MESSAGE.format(message=error_message)
         elif error_code == 400:  # Invalid request
-            error_message = (
-                f"Invalid request: {error_message}\n"
-                "Please check that the request name is in the correct format:\n"
-                "projects/[PROJECT_ID]/approvalRequests/[REQUEST_ID]"
-            )
+            error_message = INVALID_REQUEST_MESSAGE.format(message=error_message)
         elif error_code == 409:  # Conflict
             error_message = (
                 f"Conflict error: {error_message}\n"
@@ -298,39 +481,13 @@ def revoke_request(client, request_name: str) -> bool:
     """
     Revoke an approved access request.
     """
-    spinner = Halo(text=f'Revoking request: {request_name}...', spinner='dots')
+    spinner = create_spinner(f'Revoking request: {request_name}...')
     spinner.start()
 
     try:
         logger.info(f"Revoking approved request: {request_name}")
-        # First, verify the request exists and check its state
-        try:
-            request = client.projects().approvalRequests().get(
-                name=request_name
-            ).execute()
-            logger.debug(f"Current request state: {request.get('state')}")
-            logger.debug(f"Full request details: {json.dumps(request, indent=2)}")
-        except HttpError as e:
-            if e.resp.status == 404:
-                error_message = (
-                    f"Request not found: {request_name}\n"
-                    "The specified approval request may have expired or been deleted.\n"
-                    "Use --state ALL to list all available requests."
-                )
-                logger.error(error_message)
-                return False
-            raise
-
-        # Check if the request has an approval
-        if 'approve' not in request:
-            error_message = (
-                f"Cannot revoke request that is not approved.\n"
-                "Only approved requests can be revoked."
-            )
-            logger.error(error_message)
-            return False
-
-        # Use the invalidate method to revoke the approved request
+        # Use the invalidate method to revoke the approved request; it rejects
+        # requests that aren't approved, so no get() preflight is needed
         response = client.projects().approvalRequests().invalidate(
             name=request_name
         ).execute()
@@ -341,35 +498,21 @@ def revoke_request(client, request_name: str) -> bool:
         return True
 
     except HttpError as e:
-        error_details = json.loads(e.content.decode())
-        error_message = error_details.get('error', {}).get('message', 'Unknown error')
-        error_code = error_details.get('error', {}).get('code')
+        error_message = e.reason or 'Unknown error'
+        error_code = e.resp.status
 
         if error_code == 403:  # Permission denied
-            error_message = (
-                f"Permission denied: {error_message}\n\n"
-                "To revoke approved requests, you need the following IAM permissions:\n"
-                "1. accessapproval.approvalRequests.invalidate\n"
-                "2. accessapproval.settings.update\n\n"
-                "To grant these permissions:\n"
-                "1. Visit the IAM & Admin console:\n"
-                "   https://console.cloud.google.com/iam-admin/iam\n"
-                "2. Find your account or service account\n"
-                "3. Add the 'Access Approval Admin' role\n"
-                "   (or add the specific permissions listed above)\n\n"
-                "For more information, see:\n"
-                "https://cloud.google.com/access-approval/docs/access-control"
-            )
+            error_message = PERMISSION_DENIED_MESSAGE.format(
+                message=error_message, task='revoke approved requests', permission='invalidate')
+        elif error_code == 404:  # Request not found
+            error_message = NOT_FOUND_MESSAGE.format(message=request_name)
         elif error_code == 400:  # Invalid request
-            error_message = (
-                f"Invalid request: {error_message}\n"
-                "Please check that the request name is in the correct format:\n"
-                "projects/[PROJECT_ID]/approvalRequests/[REQUEST_ID]"
-            )
+            error_message = (INVALID_REQUEST_MESSAGE.format(message=error_message)
+                             + "\nOnly approved requests can be revoked.")
         elif error_code == 409:  # Conflict
             error_message = (
                 f"Conflict error: {error_message}\n"
-                "This usually means the request has already been revoked or has expired."
+                "This usually means the request is not approved, has already been revoked or has expired."
             )
 
         logger.error(f"Failed to revoke request: {error_message}")
@@ -379,11 +522,82 @@ def revoke_request(client, request_name: str) -> bool:
         if spinner.spinner_id:
             spinner.stop()
 
-def export_requests(requests: List[Dict], format: str, output_path: str = None):
+def batch_modify_requests(client, action: str, request_names: List[str]) -> Dict[str, bool]:
+    """
+    Approve, dismiss or revoke several requests using batched HTTP calls,
+    up to BATCH_LIMIT requests per round trip.
+    Returns a mapping of request name to whether the action succeeded.
+    """
+    approval_resource = client.projects().approvalRequests()
+    build_request = {
+        'approve': lambda name: approval_resource.approve(name=name, body={'expireTime': None}),
+        'dismiss': lambda name: approval_resource.dismiss(name=name),
+        'revoke': lambda name: approval_resource.invalidate(name=name),
+    }[action]
+    results = {}
+
+    def record_result(request_id, response, exception):
+        if exception is None:
+            logger.info(f"Successfully {ACTION_PAST_TENSE[action]} request: {request_id}")
+            results[request_id] = True
+        else:
+            reason = getattr(exception, 'reason', None) or str(exception)
+            logger.error(f"Failed to {action} request {request_id}: {reason}")
+            results[request_id] = False
+
+    # Batch request ids must be unique, so drop repeated names
+    names = list(dict.fromkeys(request_names))
+    for start in range(0, len(names), BATCH_LIMIT):
+        batch = client.new_batch_http_request(callback=record_result)
+        for name in names[start:start + BATCH_LIMIT]:
+            batch.add(build_request(name), request_id=name)
+        batch.execute()
+
+    return results
+
+def report_batch_results(action: str, results: Dict[str, bool]) -> bool:
+    """Print the outcome of a batched action per request. Returns True if all succeeded."""
+    for name, succeeded in results.items():
+        if succeeded:
+            print(f"Successfully {ACTION_PAST_TENSE[action]} request: {name}")
+        else:
+            print(f"Failed to {action} request: {name}", file=sys.stderr)
+    return all(results.values())
+
+# Column order for CSV exports; nested fields use dotted names
+CSV_HEADERS = ['name', 'state', 'requestTime', 'requestedResourceName',
+               'requestedReason.type', 'requestedReason.detail',
+               'requestedExpiration', 'requestedLocations']
+
+def flatten_request(request: Dict) -> tuple:
+    """
+    Flatten nested request fields into a CSV row ordered like CSV_HEADERS.
+    """
+    get = request.get
+    reason = get('requestedReason') or _NO_FIELDS
+    expiration = get('requestedExpiration')
+    if isinstance(expiration, dict):
+        expiration = expiration.get('expireTime')
+    return (
+        get('name'),
+        get('state', 'N/A'),
+        get('requestTime'),
+        get('requestedResourceName'),
+        reason.get('type'),
+        reason.get('detail'),
+        expiration,
+        json.dumps(get('requestedLocations', {}))
+    )
+
+def export_requests(requests: Iterable[Dict], format: str, output_path: str = None):
     """
     Export approval requests to JSON or CSV format.
+    Records are written as they are read, so a paginated generator can be
+    exported without holding every request in memory. The output goes to a
+    temporary file that only replaces output_path once every page has been
+    written, so a failed fetch never truncates an existing export.
     Args:
-        requests: List of approval request dictionaries
+        requests: Iterable of approval request dictionaries
         format: Output format ('json' or 'csv')
         output_path: Optional output file path
     """
@@ -391,39 +605,45 @@ def export_requests(requests: List[Dict], format: str, output_path: str = None):
         output_path = f"approval_requests.{format}"
 
     try:
-        if format == 'json':
-            with open(output_path, 'w') as f:
-                json.dump(requests, f, indent=2)
-        else:  # CSV format
-            if not requests:
-                logger.warning("No requests to export")
-                return
+        requests = iter(requests)
+        # Fetch the first page before touching the filesystem
+        first = next(requests, None)
+        if first is None and format != 'json':
+            logger.warning("No requests to export")
+            return
+        records = chain((first,), requests) if first is not None else iter(())
 
-            # Extract fields from the first request to use as CSV headers
-            headers = ['name', 'state', 'requestTime', 'requestedResourceName',
-                      'requestedReason.type', 'requestedReason.detail',
-                      'requestedExpiration', 'requestedLocations']
-
-            with open(output_path, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-                for request in requests:
-                    # Flatten nested structures for CSV
-                    row = {
-                        'name': request.get('name'),
-                        'state': request.get('state', 'N/A'),
-                        'requestTime': request.get('requestTime'),
-                        'requestedResourceName': request.get('requestedResourceName'),
-                        'requestedReason.type': request.get('requestedReason', {}).get('type'),
-                        'requestedReason.detail': request.get('requestedReason', {}).get('detail'),
-                        'requestedExpiration': (
-                            request.get('requestedExpiration', {}).get('expireTime')
-                            if isinstance(request.get('requestedExpiration'), dict)
-                            else request.get('requestedExpiration')
-                        ),
-                        'requestedLocations': json.dumps(request.get('requestedLocations', {}))
-                    }
-                    writer.writerow(row)
+        # Same directory as the target, so os.replace() is an atomic rename
+        temp_file = tempfile.NamedTemporaryFile(
+            'w', dir=os.path.dirname(os.path.abspath(output_path)),
+            prefix='.export-', suffix='.tmp', delete=False,
+            newline='' if format == 'csv' else None
+        )
+        try:
+            with temp_file as f:
+                if format == 'json':
+                    # Same layout as json.dump(requests, f, indent=2), one record at a time
+                    separator = "[\n  "
+                    for request in records:
+                        f.write(separator)
+                        f.write(json.dumps(request, indent=2).replace("\n", "\n  "))
+                        separator = ",\n  "
+                    f.write("[]" if separator == "[\n  " else "\n]")
+                else:  # CSV format
+                    writer = csv.writer(f)
+                    writer.writerow(CSV_HEADERS)
+                    writer.writerows(map(flatten_request, records))
+            # Temporary files are private; keep the mode of the export being
+            # replaced, or give a new one the usual permissions
+            try:
+                mode = stat.S_IMODE(os.stat(output_path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(temp_file.name, mode)
+            os.replace(temp_file.name, output_path)
+        except BaseException:
+            os.unlink(temp_file.name)
+            raise
 
         logger.info(f"Successfully exported requests to {output_path}")
     except Exception as e:
@@ -432,6 +652,11 @@ def export_requests(requests: List[Dict], format: str, output_path: str = None):
 
 def check_terminal_requirements():
     """Check if the terminal meets the minimum requirements for interactive mode."""
+    # A known terminal on both ends needs no probe; initscr() has to read
+    # terminfo and allocate the whole screen just to be torn down again
+    if (sys.stdin.isatty() and sys.stdout.isatty()
+            and os.environ.get('TERM') not in (None, '', 'dumb')):
+        return True
     try:
         import curses
         stdscr = curses.initscr()
@@ -466,11 +691,15 @@ def main():
             print("Please try running without the --interactive flag.", file=sys.stderr)
             sys.exit(1)
 
+        # Spinner output shares stdout, so keep it out of machine-readable listings
+        quiet = args.format == 'ndjson' and not (args.interactive or args.export)
+
         # Set up authentication
-        auth_spinner = Halo(text='Authenticating with Google Cloud...', spinner='dots')
+        auth_spinner = create_spinner('Authenticating with Google Cloud...', enabled=not quiet)
         auth_spinner.start()
         try:
             credentials, project_id = setup_credentials()
+            refresh_credentials(credentials)
             auth_spinner.succeed('Authentication successful')
         except Exception as e:
             auth_spinner.fail(f'Authentication failed: {str(e)}')
@@ -480,7 +709,7 @@ def main():
                 auth_spinner.stop()
 
         # Initialize API client
-        client_spinner = Halo(text='Initializing Access Approval API client...', spinner='dots')
+        client_spinner = create_spinner('Initializing Access Approval API client...', enabled=not quiet)
         client_spinner.start()
         try:
             client = initialize_api_client(credentials)
@@ -492,34 +721,53 @@ def main():
             if client_spinner.spinner_id:
                 client_spinner.stop()
 
+        # Several names for one action are sent together as batched HTTP requests
+        for action, request_names in (('approve', args.approve), ('revoke', args.revoke),
+                                      ('dismiss', args.dismiss)):
+            if request_names and len(request_names) > 1:
+                batch_spinner = create_spinner(f'Sending {len(request_names)} {action} requests...')
+                batch_spinner.start()
+                try:
+                    results = batch_modify_requests(client, action, request_names)
+                finally:
+                    if batch_spinner.spinner_id:
+                        batch_spinner.stop()
+
+                if not report_batch_results(action, results):
+                    sys.exit(1)
+                return
+
         # Handle various operations with spinners
         if args.approve:
-            if approve_request(client, args.approve):
-                print(f"Successfully approved request: {args.approve}")
+            request_name = args.approve[0]
+            if approve_request(client, request_name):
+                print(f"Successfully approved request: {request_name}")
                 return
             else:
-                print(f"Failed to approve request: {args.approve}", file=sys.stderr)
+                print(f"Failed to approve request: {request_name}", file=sys.stderr)
                 sys.exit(1)
 
         if args.revoke:
-            if revoke_request(client, args.revoke):
-                print(f"Successfully revoked request: {args.revoke}")
+            request_name = args.revoke[0]
+            if revoke_request(client, request_name):
+                print(f"Successfully revoked request: {request_name}")
                 return
             else:
-                print(f"Failed to revoke request: {args.revoke}", file=sys.stderr)
+                print(f"Failed to revoke request: {request_name}", file=sys.stderr)
                 sys.exit(1)
 
         if args.dismiss:
-            dismiss_spinner = Halo(text=f'Dismissing request: {args.dismiss}...', spinner='dots')
+            request_name = args.dismiss[0]
+            dismiss_spinner = create_spinner(f'Dismissing request: {request_name}...')
             dismiss_spinner.start()
             try:
-                if dismiss_request(client, args.dismiss):
-                    print(f"Successfully dismissed request: {args.dismiss}")
-                    dismiss_spinner.succeed(f'Successfully dismissed request: {args.dismiss}')
+                if dismiss_request(client, request_name):
+                    print(f"Successfully dismissed request: {request_name}")
+                    dismiss_spinner.succeed(f'Successfully dismissed request: {request_name}')
                     return
                 else:
-                    dismiss_spinner.fail(f'Failed to dismiss request: {args.dismiss}')
-                    print(f"Failed to dismiss request: {args.dismiss}", file=sys.stderr)
+                    dismiss_spinner.fail(f'Failed to dismiss request: {request_name}')
+                    print(f"Failed to dismiss request: {request_name}", file=sys.stderr)
                     sys.exit(1)
             except Exception as e:
                 dismiss_spinner.fail(f"Failed to dismiss request: {str(e)}")
@@ -529,28 +777,51 @@ def main():
                     dismiss_spinner.stop()
 
 
-        # Get approval requests
-        approval_requests = get_approval_requests(client, project_id, args.state)
+        if args.projects:
+            # Several projects are listed concurrently, one client per worker
+            def list_requests():
+                return iter_project_requests(credentials, args.projects, args.state)
+        else:
+            def list_requests():
+                return iter_approval_requests(client, project_id, args.state)
 
         if args.interactive:
+            approval_requests = collect_with_spinner(list_requests())
             from interactive_viewer import view_requests
-            viewer = None
+            # Refreshes after an action run while the viewer is already back on screen
+            refresh_executor = ThreadPoolExecutor(max_workers=1)
+            refresh = None
             try:
                 while True:  # Keep the interactive session running
-                    # Initialize viewer with current requests
-                    if viewer is None:
-                        result = view_requests(approval_requests)
-                    else:
-                        # Re-use existing viewer
-                        result = curses.wrapper(lambda stdscr: viewer.run(stdscr))
+                    result = view_requests(approval_requests, refresh)
 
                     if not result:  # User quit the viewer or error occurred
                         break
 
-                    request_name = result['request']['name']
+                    if refresh is not None:
+                        # The client is not thread-safe, so let the refresh
+                        # finish before making the next call
+                        try:
+                            approval_requests = refresh.result()
+                        except Exception as e:
+                            logger.error(f"Failed to refresh requests: {e}")
+                        refresh = None
+
+                    # Act on the marked requests when there are any, not the highlighted row
+                    marked = result.get('requests') or [result['request']]
+                    request_name = marked[0]['name']
                     success = False
-
-                    if result['action'] == 'approve':
+                    acted = {request_name}
+
+                    if len(marked) > 1:
+                        # Marked requests are sent together as batched HTTP requests
+                        results = batch_modify_requests(
+                            client, result['action'], [request['name'] for request in marked]
+                        )
+                        report_batch_results(result['action'], results)
+                        success = any(results.values())
+                        acted = {name for name, succeeded in results.items() if succeeded}
+                    elif result['action'] == 'approve':
                         success = approve_request(client, request_name)
                         if success:
                             print(f"Successfully approved request: {request_name}")
@@ -569,11 +840,15 @@ def main():
                         else:
                             print(f"Failed to revoke request: {request_name}", file=sys.stderr)
 
-                    # Refresh the requests list after action
+                    # Refresh the requests list after action, without waiting for it
                     if success:
-                        approval_requests = get_approval_requests(client, project_id, args.state)
-                        if viewer:
-                            viewer.update_requests(approval_requests)
+                        if args.state != 'ALL':
+                            # A successful action moves a request out of the listed
+                            # state, so drop it now instead of showing it until the
+                            # refresh lands
+                            approval_requests = [request for request in approval_requests
+                                                 if request.get('name') not in acted]
+                        refresh = refresh_executor.submit(lambda: list(list_requests()))
                     # Clear the screen before re-entering interactive mode
                     print("\033[2J\033[H", end='')  # ANSI escape sequence to clear screen
 
@@ -583,16 +858,17 @@ def main():
                     import traceback
                     traceback.print_exc()
             finally:
-                if viewer:
-                    viewer.clean_up()
+                # A refresh still running on quit is discarded; don't wait out its fetch
+                refresh_executor.shutdown(wait=False, cancel_futures=True)
             return
 
         # Export or display results
         if args.export:
-            export_spinner = Halo(text=f'Exporting requests to {args.export} format...', spinner='dots')
+            # Pages are written to the export file as they arrive
+            export_spinner = create_spinner(f'Exporting requests to {args.export} format...')
             export_spinner.start()
             try:
-                export_requests(approval_requests, args.export, args.output)
+                export_requests(list_requests(), args.export, args.output)
                 export_spinner.succeed(f'Successfully exported requests to {args.output or f"approval_requests.{args.export}"}')
             except Exception as e:
                 export_spinner.fail(f'Failed to export requests: {str(e)}')
@@ -600,9 +876,11 @@ def main():
             finally:
                 if export_spinner.spinner_id:
                     export_spinner.stop()
+        elif args.format == 'ndjson':
+            display_ndjson(list_requests())
         else:
-            # Display results
-            display_approval_requests(approval_requests, args.state)
+            # Display results as each page arrives
+            display_approval_requests(stream_with_spinner(list_requests()), args.state)
 
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
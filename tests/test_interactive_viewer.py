@@ -0,0 +1,147 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import unicodedata
+from concurrent.futures import Future
+import sys
+import os
+
+# Add parent directory to path to import the viewer module
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
+from interactive_viewer import (
+    RequestViewer, _wrap_text, _truncate_to_width, _pad_to_width, _lookup, _location_label
+)
+
+class TestRequestViewer(unittest.TestCase):
+    def setUp(self):
+        self.viewer = RequestViewer([])
+
+    def test_wrap_text_breaks_on_spaces(self):
+        """Test wrapping splits on the last space that fits"""
+        self.assertEqual(
+            self.viewer.wrap_text("Case Number: 12345", 12),
+            ["Case Number:", "12345"]
+        )
+
+    def test_wrap_text_breaks_long_words(self):
+        """Test wrapping hard-breaks values without spaces, such as resource names"""
+        text = "//storage.googleapis.com/projects/123"
+        lines = self.viewer.wrap_text(text, 10)
+        self.assertEqual("".join(lines), text)
+        self.assertTrue(all(len(line) <= 10 for line in lines))
+
+    def test_wrap_text_edge_cases(self):
+        """Test wrapping of empty values and non-positive widths"""
+        self.assertEqual(self.viewer.wrap_text("", 10), [])
+        self.assertEqual(self.viewer.wrap_text("short", 10), ["short"])
+        self.assertEqual(self.viewer.wrap_text("ab", 0), ["a", "b"])
+
+    def test_wrap_text_is_cached(self):
+        """Test repeated wraps of the same value are served from the cache"""
+        _wrap_text.cache_clear()
+        self.viewer.wrap_text("Case Number: 12345", 12)
+        self.viewer.wrap_text("Case Number: 12345", 12)
+        self.assertEqual(_wrap_text.cache_info().hits, 1)
+
+    def test_truncate_to_width(self):
+        """Test truncation counts wide characters as two terminal columns"""
+        self.assertEqual(_truncate_to_width("↑/↓: Navigate", 20), "↑/↓: Navigate")
+        self.assertEqual(_truncate_to_width("東京リージョン", 8), "東京...")
+        self.assertEqual(_truncate_to_width("東京", 4), "東京")
+
+    def test_pad_to_width(self):
+        """Test padding and cutting count wide characters as two terminal columns"""
+        self.assertEqual(_pad_to_width("abc", 5), "abc  ")
+        self.assertEqual(_pad_to_width("abcdef", 4), "abcd")
+        self.assertEqual(_pad_to_width("東京", 6), "東京  ")
+        # A wide character that does not fit is replaced by padding
+        self.assertEqual(_pad_to_width("東京", 3), "東 ")
+
+    def test_prerendered_rows_fill_body_width(self):
+        """Test wide characters do not make batched list or detail rows overflow"""
+        viewer = RequestViewer([{
+            "name": "projects/123/approvalRequests/東京リージョン",
+            "requestedReason": {"detail": "Case Number: 12345 東京リージョン"},
+            "requestedLocations": {"principalOfficeCountry": "JP"},
+        }])
+        viewer._geometry = (24, 100, 33)
+        viewer._prerender()
+        def columns(text):
+            return sum(2 if unicodedata.east_asian_width(ch) in 'WF' else 1 for ch in text)
+
+        lines, _ = viewer._detail_rows(0)
+        self.assertEqual({columns(line) for line in lines}, {viewer._detail_width})
+        self.assertEqual(columns(viewer._list_labels[0]), 31)
+
+    def test_lookup_missing_fields(self):
+        """Test nested field lookup falls back to N/A for missing or null parents"""
+        request = {"requestedReason": {"type": "CUSTOMER_INITIATED_SUPPORT"}}
+        self.assertEqual(_lookup(request, ("requestedReason", "type")), "CUSTOMER_INITIATED_SUPPORT")
+        self.assertEqual(_lookup(request, ("requestedReason", "detail")), "N/A")
+        self.assertEqual(_lookup({}, ("requestedReason", "type")), "N/A")
+        self.assertEqual(_lookup({"requestedReason": None}, ("requestedReason", "type")), "N/A")
+
+    def test_location_label(self):
+        """Test known location keys use the fixed labels and others are split into words"""
+        self.assertEqual(_location_label("principalOfficeCountry"), "Principal Office Country")
+        self.assertEqual(
+            _location_label("principalPhysicalLocationCountry"), "Principal Physical Location Country"
+        )
+        self.assertEqual(_location_label("principalRegionCountry"), "Principal Region Country")
+
+    def test_resize_below_minimum_shows_notice(self):
+        """Test shrinking the terminal below the minimum size shows a notice instead of raising"""
+        stdscr = MagicMock()
+        stdscr.getmaxyx.return_value = (8, 60)
+        with patch('curses.update_lines_cols'), patch('curses.LINES', 8, create=True), \
+                patch('curses.COLS', 60, create=True):
+            self.viewer.handle_resize(stdscr)
+        self.assertTrue(self.viewer._too_small)
+        written = " ".join(str(c.args[2]) for c in stdscr.addstr.call_args_list)
+        self.assertIn("Terminal too small", written)
+
+    def test_marked_requests(self):
+        """Test marking rows selects them for a batched action and refresh clears marks"""
+        viewer = RequestViewer([{"name": "a"}, {"name": "b"}, {"name": "c"}])
+        self.assertEqual(viewer.selected_requests(), [{"name": "a"}])
+        viewer.current_index = 2
+        viewer.toggle_mark()
+        viewer.current_index = 0
+        viewer.toggle_mark()
+        self.assertEqual(viewer.selected_requests(), [{"name": "a"}, {"name": "c"}])
+        viewer.toggle_mark()
+        self.assertEqual(viewer.selected_requests(), [{"name": "c"}])
+        viewer.update_requests([{"name": "b"}])
+        self.assertEqual(viewer.marked, set())
+
+    def test_background_refresh_keeps_marks_by_name(self):
+        """Test a completed background refresh keeps the marks and the selection on the same requests"""
+        viewer = RequestViewer([{"name": "a"}, {"name": "b"}])
+        viewer.toggle_mark()
+        viewer.current_index = 1
+        future = Future()
+        viewer.refresh_in_background(future)
+        future.set_result([{"name": "new"}, {"name": "a"}, {"name": "b"}])
+        viewer._apply_pending()
+        self.assertEqual(len(viewer.requests), 3)
+        self.assertEqual(viewer.selected_requests(), [{"name": "a"}])
+        # The highlight stays on the request it was on, not the same position
+        self.assertEqual(viewer.requests[viewer.current_index], {"name": "b"})
+        self.assertEqual(viewer.top_line, 1)
+
+    def test_refresh_clamps_selection_when_request_disappears(self):
+        """Test the selection falls back to a valid index when its request is gone"""
+        viewer = RequestViewer([{"name": "a"}, {"name": "b"}, {"name": "c"}])
+        viewer.current_index = 2
+        viewer.update_requests([{"name": "a"}])
+        self.assertEqual(viewer.current_index, 0)
+
+    def test_format_timestamp(self):
+        """Test timestamp formatting in the viewer"""
+        self.assertEqual(self.viewer.format_timestamp("2025-02-18T10:30:00Z"),
+                         "2025-02-18 10:30:00 UTC")
+        self.assertEqual(self.viewer.format_timestamp("N/A"), "N/A")
+
+if __name__ == '__main__':
+    unittest.main()
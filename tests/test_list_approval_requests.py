@@ -1,48 +1,61 @@
 import unittest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, Mock, MagicMock, call
 import sys
 import os
+import json
 from datetime import datetime
 from io import StringIO
+from contextlib import redirect_stdout
 import logging
 
 # Add parent directory to path to import the main script
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
 from list_approval_requests import (
     format_timestamp,
     display_approval_requests,
+    display_ndjson,
     parse_arguments,
     get_approval_requests,
+    iter_approval_requests,
+    iter_project_requests,
+    batch_modify_requests,
+    create_spinner,
+    export_requests,
+    logger,
     main
 )
 
+# Lines printed for the sample request used by the display tests, apart from its state
+EXPECTED_SAMPLE_LINES = (
+    "Approval Requests (State: PENDING):",
+    "Request Name: projects/123456789/approvalRequests/abcd1234",
+    "Request Time: 2025-02-18 10:30:00 UTC",
+    "Requested Resource: //compute.googleapis.com/projects/test",
+    "Requested Reason: CUSTOMER_INITIATED_SUPPORT",
+    "Reason Detail: Case Number: 12345",
+    "Expiration Time: 2025-02-19 10:30:00 UTC",
+)
+
 class TestListApprovalRequests(unittest.TestCase):
     def setUp(self):
         self.maxDiff = None
+        # Capture stdout for the duration of the test; restored even if setUp fails later
         self.captured_output = StringIO()
-        self.original_stdout = sys.stdout
-        sys.stdout = self.captured_output
-        # Capture logging output
-        self.log_output = StringIO()
-        self.log_handler = logging.StreamHandler(self.log_output)
-        logging.getLogger().addHandler(self.log_handler)
-        logging.getLogger().setLevel(logging.INFO)
-
-    def tearDown(self):
-        sys.stdout = self.original_stdout
-        logging.getLogger().removeHandler(self.log_handler)
-        logging.getLogger().setLevel(logging.INFO)
+        self.enterContext(redirect_stdout(self.captured_output))
 
     def test_format_timestamp(self):
         """Test timestamp formatting function"""
-        # Test valid timestamp
-        input_timestamp = "2025-02-18T10:30:00Z"
-        expected_output = "2025-02-18 10:30:00 UTC"
-        self.assertEqual(format_timestamp(input_timestamp), expected_output)
-
-        # Test invalid timestamp
-        invalid_timestamp = "invalid-timestamp"
-        self.assertEqual(format_timestamp(invalid_timestamp), invalid_timestamp)
+        test_cases = [
+            # Valid timestamp
+            ("2025-02-18T10:30:00Z", "2025-02-18 10:30:00 UTC"),
+            # Invalid timestamp is returned unchanged
+            ("invalid-timestamp", "invalid-timestamp"),
+        ]
+        for timestamp, expected_output in test_cases:
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(format_timestamp(timestamp), expected_output)
 
     def test_display_approval_requests_empty(self):
         """Test display function with empty requests"""
@@ -63,18 +76,9 @@ class TestListApprovalRequests(unittest.TestCase):
         display_approval_requests([sample_request], "PENDING")
         output = self.captured_output.getvalue()
 
-        expected_elements = [
-            "Approval Requests (State: PENDING):",
-            "Request Name: projects/123456789/approvalRequests/abcd1234",
-            "State: PENDING",
-            "Request Time: 2025-02-18 10:30:00 UTC",
-            "Requested Resource: //compute.googleapis.com/projects/test",
-            "Requested Reason: CUSTOMER_INITIATED_SUPPORT",
-            "Reason Detail: Case Number: 12345",
-            "Expiration Time: 2025-02-19 10:30:00 UTC"
-        ]
-        for element in expected_elements:
+        for element in EXPECTED_SAMPLE_LINES + ("State: PENDING",):
             self.assertIn(element, output)
+        self.assertEqual(output.count("Request Time:"), 1)
 
     def test_display_approval_requests_without_state(self):
         """Test display function with request missing state field"""
@@ -91,19 +95,32 @@ class TestListApprovalRequests(unittest.TestCase):
         display_approval_requests([sample_request], "PENDING")
         output = self.captured_output.getvalue()
 
-        expected_elements = [
-            "Approval Requests (State: PENDING):",
-            "Request Name: projects/123456789/approvalRequests/abcd1234",
-            "State: N/A",
-            "Request Time: 2025-02-18 10:30:00 UTC",
-            "Requested Resource: //compute.googleapis.com/projects/test",
-            "Requested Reason: CUSTOMER_INITIATED_SUPPORT",
-            "Reason Detail: Case Number: 12345",
-            "Expiration Time: 2025-02-19 10:30:00 UTC"
-        ]
-        for element in expected_elements:
+        for element in EXPECTED_SAMPLE_LINES + ("State: N/A",):
             self.assertIn(element, output)
 
+    def test_display_ndjson(self):
+        """Test NDJSON output writes one raw request object per line"""
+        requests = [
+            {"name": "projects/123/approvalRequests/a", "requestTime": "2025-02-18T10:30:00Z"},
+            {"name": "projects/123/approvalRequests/b", "requestedReason": {"type": "CUSTOMER_INITIATED_SUPPORT"}}
+        ]
+        display_ndjson(iter(requests))
+        lines = self.captured_output.getvalue().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], requests)
+
+    def test_create_spinner_disabled_without_tty(self):
+        """Test spinners write nothing when stdout is not a terminal"""
+        spinner = create_spinner('Working...')
+        spinner.start()
+        spinner.succeed('Done')
+        self.assertIsNone(spinner.spinner_id)
+        self.assertEqual(self.captured_output.getvalue(), "")
+
+    def test_display_null_requested_reason(self):
+        """Test a null requestedReason is shown as N/A instead of failing"""
+        display_approval_requests([{"name": "test", "requestedReason": None}], 'ALL')
+        self.assertIn("Requested Reason: N/A", self.captured_output.getvalue())
+
     def test_expiration_time_edge_cases(self):
         """Test various expiration time formats and edge cases"""
         test_cases = [
@@ -129,11 +146,10 @@ class TestListApprovalRequests(unittest.TestCase):
         ]
 
         for request, expected_time in test_cases:
-            display_approval_requests([request], "ALL")
-            output = self.captured_output.getvalue()
-            self.assertIn(f"Expiration Time: {expected_time}", output)
-            self.captured_output.truncate(0)
-            self.captured_output.seek(0)
+            # Each case is reported separately and writes to its own buffer
+            with self.subTest(name=request["name"]), redirect_stdout(StringIO()) as output:
+                display_approval_requests([request], "ALL")
+                self.assertIn(f"Expiration Time: {expected_time}", output.getvalue())
 
     @patch('argparse.ArgumentParser.parse_args')
     def test_parse_arguments_debug_flag(self, mock_args):
@@ -148,10 +164,8 @@ class TestListApprovalRequests(unittest.TestCase):
         args = parse_arguments()
         self.assertFalse(args.debug)
 
-    @patch('google.auth.default')
-    @patch('googleapiclient.discovery.build')
-    def test_get_approval_requests_state_filtering(self, mock_build, mock_auth):
-        """Test filtering of approval requests by state"""
+    def test_get_approval_requests_state_filtering(self):
+        """Test state filtering is passed to the API as a server-side filter"""
         # Mock the API response with a request without state field
         mock_response = {
             "approvalRequests": [
@@ -164,29 +178,191 @@ class TestListApprovalRequests(unittest.TestCase):
         }
 
         # Set up mock client
-        mock_client = MagicMock()
-        mock_list = MagicMock()
+        # Plain Mock is enough for the client; nothing here needs magic methods
+        mock_client = Mock()
+        mock_list = Mock()
         mock_list.execute.return_value = mock_response
-        mock_client.projects().approvalRequests().list.return_value = mock_list
-        mock_client.projects().approvalRequests().list_next.return_value = None
-        mock_build.return_value = mock_client
+        approval_requests = mock_client.projects().approvalRequests()
+        approval_requests.list.return_value = mock_list
+        approval_requests.list_next.return_value = None
+        list_method = approval_requests.list
 
-        # Mock credentials
-        mock_auth.return_value = (MagicMock(), "123")
-
-        # Test PENDING state - should include request without state
+        # Test PENDING state - the server's rows are returned as-is
         requests = get_approval_requests(mock_client, "123", "PENDING")
         self.assertEqual(len(requests), 1)
+        list_method.assert_called_with(parent="projects/123", filter="PENDING", pageSize=1000)
 
-        # Test APPROVED state - should not include request without state
-        requests = get_approval_requests(mock_client, "123", "APPROVED")
-        self.assertEqual(len(requests), 0)
+        # Test APPROVED state - maps to the API's ACTIVE filter
+        get_approval_requests(mock_client, "123", "APPROVED")
+        list_method.assert_called_with(parent="projects/123", filter="ACTIVE", pageSize=1000)
 
-    @patch('sys.argv')
-    @patch('google.auth.default')
-    @patch('googleapiclient.discovery.build')
-    def test_debug_output(self, mock_build, mock_auth, mock_argv):
-        """Test debug output with and without debug flag"""
+        # Test ALL state - passed explicitly, since no filter means pending or active only
+        get_approval_requests(mock_client, "123", "ALL")
+        list_method.assert_called_with(parent="projects/123", filter="ALL", pageSize=1000)
+
+    def test_iter_approval_requests_pagination(self):
+        """Test requests are yielded page by page, prefetching the next page"""
+        first_page = MagicMock()
+        first_page.execute.return_value = {"approvalRequests": [{"name": "a"}, {"name": "b"}]}
+        second_page = MagicMock()
+        second_page.execute.return_value = {"approvalRequests": [{"name": "c"}]}
+
+        mock_client = MagicMock()
+        approval_requests = mock_client.projects().approvalRequests()
+        approval_requests.list.return_value = first_page
+        approval_requests.list_next.side_effect = [second_page, None]
+
+        requests = iter_approval_requests(mock_client, "123", "PENDING")
+        self.assertEqual(next(requests)["name"], "a")
+        # The next page is requested before the current one is handed out
+        approval_requests.list_next.assert_called_once()
+        self.assertEqual([r["name"] for r in requests], ["b", "c"])
+        self.assertEqual(second_page.execute.call_count, 1)
+
+    def test_iter_approval_requests_error_without_json_body(self):
+        """Test API errors are reported from HttpError.reason even when the body is not JSON"""
+        import httplib2
+        from googleapiclient.errors import HttpError
+
+        resp = httplib2.Response({"status": 502})
+        resp.reason = "Bad Gateway"
+        mock_client = MagicMock()
+        mock_client.projects().approvalRequests().list().execute.side_effect = HttpError(
+            resp, b"<html>upstream error</html>"
+        )
+
+        with self.assertRaisesRegex(Exception, "API request failed for project 123: Bad Gateway"):
+            list(iter_approval_requests(mock_client, "123", "PENDING"))
+
+    @patch('list_approval_requests.initialize_api_client')
+    def test_iter_project_requests(self, mock_init_client):
+        """Test several projects are listed with their own clients and merged in project order"""
+        def page_for(parent, **kwargs):
+            page = MagicMock()
+            page.execute.return_value = {"approvalRequests": [{"name": f"{parent}/approvalRequests/x"}]}
+            return page
+
+        def client_for(credentials):
+            client = MagicMock()
+            approval_requests = client.projects().approvalRequests()
+            approval_requests.list.side_effect = page_for
+            approval_requests.list_next.return_value = None
+            return client
+
+        mock_init_client.side_effect = client_for
+        requests = list(iter_project_requests(MagicMock(), ["p1", "p2", "p3"], "PENDING"))
+
+        self.assertEqual([r["name"] for r in requests],
+                         [f"projects/{p}/approvalRequests/x" for p in ("p1", "p2", "p3")])
+        self.assertEqual(mock_init_client.call_count, 3)
+
+    def test_batch_modify_requests(self):
+        """Test several requests are sent in one batch and results are collected per name"""
+        added = []
+
+        class FakeBatch:
+            def __init__(self, callback):
+                self.callback = callback
+
+            def add(self, request, request_id):
+                added.append(request_id)
+
+            def execute(self):
+                for request_id in added:
+                    error = Exception("conflict") if request_id.endswith("b") else None
+                    self.callback(request_id, {}, error)
+
+        mock_client = MagicMock()
+        mock_client.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback)
+
+        names = ["projects/123/approvalRequests/a", "projects/123/approvalRequests/b",
+                 "projects/123/approvalRequests/a"]
+        results = batch_modify_requests(mock_client, "approve", names)
+
+        self.assertEqual(added, names[:2])
+        self.assertEqual(results, {names[0]: True, names[1]: False})
+        mock_client.new_batch_http_request.assert_called_once()
+
+    @patch('interactive_viewer.view_requests')
+    @patch('list_approval_requests.approve_request', return_value=True)
+    @patch('list_approval_requests.iter_approval_requests')
+    @patch('list_approval_requests.initialize_api_client')
+    @patch('list_approval_requests.refresh_credentials')
+    @patch('list_approval_requests.setup_credentials', return_value=(MagicMock(), "123"))
+    @patch('list_approval_requests.check_terminal_requirements', return_value=True)
+    @patch('sys.argv', ["script.py", "--interactive"])
+    def test_interactive_acts_on_single_marked_request(self, mock_check, mock_setup, mock_refresh,
+                                                       mock_init_client, mock_iter, mock_approve,
+                                                       mock_view):
+        """Test an action with one marked row targets the marked request, not the highlighted one"""
+        marked = {"name": "p/req002"}
+        highlighted = {"name": "p/req003"}
+        mock_iter.return_value = iter([marked, highlighted])
+        mock_view.side_effect = [
+            {"action": "approve", "request": highlighted, "requests": [marked]},
+            None,
+        ]
+
+        main()
+
+        mock_approve.assert_called_once_with(mock_init_client.return_value, "p/req002")
+        self.assertIn("Successfully approved request: p/req002", self.captured_output.getvalue())
+
+    def test_export_requests_streams_from_iterator(self):
+        """Test JSON export from a generator matches json.dump of the same list"""
+        import tempfile
+        requests = [
+            {"name": "projects/123/approvalRequests/a", "requestedReason": {"detail": "line one\nline two"}},
+            {"name": "projects/123/approvalRequests/b", "requestedLocations": {}}
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            for records in (requests, []):
+                path = os.path.join(tmp, "export.json")
+                export_requests((r for r in records), "json", path)
+                with open(path) as f:
+                    self.assertEqual(f.read(), json.dumps(records, indent=2))
+
+    def test_export_requests_keeps_existing_file_on_error(self):
+        """Test a failed fetch leaves an existing export untouched and no temporary file behind"""
+        import tempfile
+
+        def failing_pages(records):
+            yield from records
+            raise Exception("API request failed for project 123: Forbidden")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for format in ("json", "csv"):
+                path = os.path.join(tmp, f"existing.{format}")
+                with open(path, "w") as f:
+                    f.write("previous export")
+                # Failure on the first page and on a later page
+                for records in ([], [{"name": "projects/123/approvalRequests/a"}]):
+                    with self.subTest(format=format, records=len(records)):
+                        with self.assertRaises(Exception):
+                            export_requests(failing_pages(records), format, path)
+                        with open(path) as f:
+                            self.assertEqual(f.read(), "previous export")
+                        self.assertEqual([n for n in os.listdir(tmp) if n.endswith(".tmp")], [])
+
+    def test_export_requests_file_mode(self):
+        """Test a new export follows the umask and a replaced export keeps its mode"""
+        import tempfile
+        records = [{"name": "projects/123/approvalRequests/a"}]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "export.json")
+            with patch('list_approval_requests._UMASK', 0o022):
+                export_requests(iter(records), "json", path)
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o644)
+            os.chmod(path, 0o600)
+            export_requests(iter(records), "json", path)
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+
+    def _run_main_for_debug_output(self, mock_build, mock_auth, argv, capture):
+        """
+        Run main() once with the given argv against a mocked client, inside
+        the given assertLogs/assertNoLogs context on the module logger.
+        Returns the context's value and the parent passed to list().
+        """
         # Mock API response
         mock_response = {
             "approvalRequests": [
@@ -198,36 +374,43 @@ class TestListApprovalRequests(unittest.TestCase):
         }
 
         # Set up mocks
-        mock_client = MagicMock()
-        mock_list = MagicMock()
+        mock_client = Mock()
+        mock_list = Mock()
         mock_list.execute.return_value = mock_response
-        mock_client.projects().approvalRequests().list.return_value = mock_list
-        mock_client.projects().approvalRequests().list_next.return_value = None
+        approval_requests = mock_client.projects().approvalRequests()
+        approval_requests.list.return_value = mock_list
+        approval_requests.list_next.return_value = None
         mock_build.return_value = mock_client
         mock_auth.return_value = (MagicMock(), "123")
 
-        # Test without debug flag
-        mock_argv.return_value = ["script.py"]
-        logging.getLogger().setLevel(logging.INFO) # added line
-        main()
-        normal_output = self.log_output.getvalue()
-        self.assertNotIn("Making API request with parent:", normal_output)
-        self.assertNotIn("Received response:", normal_output)
-
-        # Clear outputs
-        self.log_output.truncate(0)
-        self.log_output.seek(0)
-        self.captured_output.truncate(0)
-        self.captured_output.seek(0)
-
-        # Test with debug flag
-        mock_argv.return_value = ["script.py", "--debug"]
-        logging.getLogger().setLevel(logging.INFO) # added line
-        main()
-        debug_output = self.log_output.getvalue()
+        self.addCleanup(logger.setLevel, logger.level)
+        with capture as captured:
+            # The capture lowers the logger to DEBUG; only --debug should do that
+            logger.setLevel(logging.INFO)
+            with patch.object(sys, 'argv', argv):
+                main()
+        return captured, approval_requests.list.call_args.kwargs['parent']
+
+    @patch('google.auth.default')
+    @patch('googleapiclient.discovery.build')
+    def test_debug_output_without_flag(self, mock_build, mock_auth):
+        """Test debug output is absent without the debug flag"""
+        # A plain listing logs nothing at INFO either, so no record at all is expected
+        self._run_main_for_debug_output(
+            mock_build, mock_auth, ["script.py"], self.assertNoLogs(logger, 'DEBUG')
+        )
+
+    @patch('google.auth.default')
+    @patch('googleapiclient.discovery.build')
+    def test_debug_output(self, mock_build, mock_auth):
+        """Test debug output with the debug flag"""
+        captured, parent = self._run_main_for_debug_output(
+            mock_build, mock_auth, ["script.py", "--debug"], self.assertLogs(logger, 'DEBUG')
+        )
+        messages = [record.getMessage() for record in captured.records]
         # Debug messages should be present when debug flag is used
-        self.assertIn("Making API request with parent: projects/123", debug_output)
-        self.assertIn("Received response:", debug_output)
+        self.assertIn(f"Making API request with parent: {parent}", messages)
+        self.assertTrue(any(m.startswith("Raw API response:") for m in messages))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
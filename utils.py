@@ -0,0 +1,34 @@
+"""
+Helpers shared by the command line tool and the interactive viewer.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+try:
+    # Optional C parser; noticeably faster than fromisoformat when installed
+    from ciso8601 import parse_datetime
+except ImportError:
+    def parse_datetime(timestamp: str) -> datetime:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+@lru_cache(maxsize=4096)
+def format_timestamp(timestamp: str) -> str:
+    """
+    Format API timestamp to human-readable format.
+    Results are memoized per raw string since the same timestamps are
+    formatted on every listing and viewer redraw.
+    """
+    # Missing fields are passed through without attempting a parse
+    if not timestamp or timestamp == 'N/A':
+        return timestamp
+    # The API always sends RFC 3339 UTC times (YYYY-MM-DDTHH:MM:SS[.fff]Z),
+    # which can be reformatted by slicing without building a datetime
+    if (len(timestamp) >= 20 and timestamp[-1] == 'Z' and timestamp[4] == '-'
+            and timestamp[7] == '-' and timestamp[10] == 'T' and timestamp[13] == ':'
+            and timestamp[16] == ':'):
+        return f"{timestamp[:10]} {timestamp[11:19]} UTC"
+    try:
+        return parse_datetime(timestamp).strftime('%Y-%m-%d %H:%M:%S UTC')
+    except ValueError:
+        return timestamp